@@ -16,6 +16,10 @@ from src.features.build_features import build_features
 DATA_PATH = os.path.join(project_root, "data", "processed", "Telco-Customer-Churn.csv")
 TARGET_COL = "Churn"
 
+# head() repr formatting is expensive on wide frames — only print the
+# previews when explicitly asked for
+VERBOSE = bool(os.environ.get("VERBOSE"))
+
 def main():
     print("=== Testing Phase 1: Load → Preprocess → Build Features ===")
 
@@ -23,19 +27,22 @@ def main():
     print("\n[1] Loading data...")
     df = load_data(DATA_PATH)
     print(f"Data loaded. Shape: {df.shape}")
-    print(df.head(3))
+    if VERBOSE:
+        print(df.head(3))
 
     # 2. Preprocess
     print("\n[2] Preprocessing data...")
     df_clean = preprocess_data(df, target_col=TARGET_COL)
     print(f"Data after preprocessing. Shape: {df_clean.shape}")
-    print(df_clean.head(3))
+    if VERBOSE:
+        print(df_clean.head(3))
 
     # 3. Build Features
     print("\n[3] Building features...")
     df_features = build_features(df_clean, target_col=TARGET_COL)
     print(f"Data after feature engineering. Shape: {df_features.shape}")
-    print(df_features.head(3))
+    if VERBOSE:
+        print(df_features.head(3))
 
     print("\n✅ Phase 1 pipeline completed successfully!")
 
@@ -7,7 +7,7 @@ import sys
 # Ensure we can import from src/serving when running "uvicorn src.app.app:app"
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from serving.inference import predict  # our single source of truth for inference
+from serving.inference import format_prediction, predict, predict_async  # our single source of truth for inference
 
 app = FastAPI()
 
@@ -38,10 +38,10 @@ class CustomerData(BaseModel):
     TotalCharges: float
 
 @app.post("/predict")
-def api_predict(data: CustomerData):
+async def api_predict(data: CustomerData):
     try:
-        out = predict(data.dict())
-        return {"prediction": out}
+        out = await predict_async(data.dict())
+        return {"prediction": format_prediction(out)}
     except Exception as e:
         return {"error": str(e)}
 
@@ -74,7 +74,7 @@ def gradio_interface(
         "TotalCharges": float(TotalCharges),
     }
     out = predict(payload)
-    return str(out)
+    return format_prediction(out)
 
 demo = gr.Interface(
     fn=gradio_interface,
@@ -17,7 +17,7 @@ import gradio as gr
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from serving.inference import predict
+from serving.inference import format_prediction, predict, predict_async
 # from src.serving.inference import predict  # Core ML inference logic
 
 # Initialize FastAPI application
@@ -76,23 +76,27 @@ class CustomerData(BaseModel):
 
 # === MAIN PREDICTION API ENDPOINT ===
 @app.post("/predict")
-def get_prediction(data: CustomerData):
+async def get_prediction(data: CustomerData):
     """
     Main prediction endpoint for customer churn prediction.
-    
+
     This endpoint:
     1. Receives validated customer data via Pydantic model
     2. Calls the inference pipeline to transform features and predict
     3. Returns churn prediction in JSON format
-    
+
+    Concurrent requests are coalesced server-side into one model call
+    (see serving.inference dynamic batching).
+
     Expected Response:
     - {"prediction": "Likely to churn"} or {"prediction": "Not likely to churn"}
     - {"error": "error_message"} if prediction fails
     """
     try:
-        # Convert Pydantic model to dict and call inference pipeline
-        result = predict(data.dict())
-        return {"prediction": result}
+        # Convert Pydantic model to dict and call inference pipeline;
+        # the label is rendered here, at the response edge
+        result = await predict_async(data.dict())
+        return {"prediction": format_prediction(result)}
     except Exception as e:
         # Return error details for debugging (consider logging in production)
         return {"error": str(e)}
@@ -143,7 +147,7 @@ def gradio_interface(
     
     # Call same inference pipeline as API endpoint
     result = predict(data)
-    return str(result)  # Return as string for Gradio display
+    return format_prediction(result)  # Render label for Gradio display
 
 # === GRADIO UI CONFIGURATION ===
 # Build comprehensive Gradio interface with all customer features
@@ -1,10 +1,29 @@
+import csv
 import pandas as pd
 import os
 
+# Right-sized dtypes for the known Telco numeric columns. String
+# columns are deliberately left as object dtype: preprocess_data only
+# maps the Churn target when it sees object dtype, and build_features
+# discovers categoricals via select_dtypes(include=["object"]), so
+# loading them as categories would silently skip all encoding.
+# TotalCharges is also absent — the raw file contains blank strings
+# there, which preprocess_data coerces to numeric later.
+TELCO_DTYPES = {
+    "SeniorCitizen": "int8",
+    "tenure": "int16",
+    "MonthlyCharges": "float32",
+}
+
+
 def load_data(file_path: str) -> pd.DataFrame:
     """
     Loads CSV data into a pandas DataFrame.
 
+    Uses the pyarrow engine (multi-threaded, single dtype-inference
+    pass) when available and right-sizes the known Telco numeric
+    columns.
+
     Args:
         file_path (str): Path to the CSV file.
 
@@ -13,5 +32,15 @@ def load_data(file_path: str) -> pd.DataFrame:
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
-    
-    return pd.read_csv(file_path)
\ No newline at end of file
+
+    # Only pass dtypes for columns actually present so the loader stays
+    # usable for non-Telco CSVs (e.g. already-processed feature files).
+    with open(file_path, newline="") as f:
+        header = next(csv.reader(f), [])
+    dtypes = {c: TELCO_DTYPES[c] for c in header if c in TELCO_DTYPES}
+
+    try:
+        return pd.read_csv(file_path, engine="pyarrow", dtype=dtypes)
+    except (ImportError, ValueError):
+        # pyarrow missing or engine rejected an option — default engine
+        return pd.read_csv(file_path, dtype=dtypes)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -80,7 +81,10 @@ def build_features(df: pd.DataFrame, target_col: str = "Churn") -> pd.DataFrame:
     # XGBoost requires integer inputs, not boolean
     bool_cols = df.select_dtypes(include=["bool"]).columns.tolist()
     if bool_cols:
-        df[bool_cols] = df[bool_cols].astype(int)
+        # Reinterpret each bool buffer as int8 instead of astype(int):
+        # same 0/1 values, but no copy and no 8x widening to int64
+        for c in bool_cols:
+            df[c] = df[c].to_numpy().view(np.int8)
         print(f"   🔄 Converted {len(bool_cols)} boolean columns to int: {bool_cols}")
 
     # === STEP 5: One-Hot Encoding for Multi-Category Features ===
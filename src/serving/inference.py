@@ -11,10 +11,19 @@ Key guarantees:
 - Explicit failure if model or schema is missing
 """
 
+import asyncio
+import logging
 import os
+import numpy as np
 import pandas as pd
 import mlflow
 
+log = logging.getLogger(__name__)
+
+# Lazy column-level copies instead of eager whole-frame copies for any
+# pandas operations left on the serving path.
+pd.set_option("mode.copy_on_write", True)
+
 # ============================================================
 # MODEL LOADING (FAIL FAST – PRODUCTION SAFE)
 # ============================================================
@@ -31,12 +40,38 @@ if not os.path.exists(MODEL_DIR):
 
 try:
     model = mlflow.pyfunc.load_model(MODEL_DIR)
-    print(f"✅ Model loaded successfully from {MODEL_DIR}")
+    log.info("Model loaded successfully from %s", MODEL_DIR)
 except Exception as e:
     raise RuntimeError(
         f"❌ Failed to load MLflow model from {MODEL_DIR}: {e}"
     )
 
+# ============================================================
+# OPTIONAL RAW-MODEL FAST PATH (BYPASS PYFUNC WRAPPER)
+# ============================================================
+# mlflow.pyfunc re-runs schema validation and dtype coercion on every
+# predict call. With USE_RAW_PREDICT=1 we unwrap the underlying
+# estimator once at load time and feed it the float32 matrix directly;
+# feature order parity is already guaranteed by FEATURE_COLS. Off by
+# default so the validated pyfunc path stays the production fallback.
+
+USE_RAW_PREDICT = os.environ.get("USE_RAW_PREDICT", "0") == "1"
+
+_raw_predict = None
+if USE_RAW_PREDICT:
+    _impl = getattr(model, "_model_impl", None)
+    _inner = (
+        getattr(_impl, "sklearn_model", None)
+        or getattr(_impl, "xgb_model", None)
+        or getattr(_impl, "python_model", None)
+        or _impl
+    )
+    if callable(getattr(_inner, "predict", None)):
+        _raw_predict = _inner.predict
+        log.info("Raw predict fast path enabled (pyfunc wrapper bypassed)")
+    else:
+        log.warning("USE_RAW_PREDICT set but no raw estimator found – using pyfunc")
+
 # ============================================================
 # FEATURE SCHEMA LOADING (STRICT ORDER GUARANTEE)
 # ============================================================
@@ -46,9 +81,17 @@ FEATURE_COLS = None
 feature_file = os.path.join(MODEL_DIR, "feature_columns.txt")
 
 if os.path.exists(feature_file):
+    # One bulk read + splitlines instead of a per-line loop; names may
+    # contain spaces (e.g. "InternetService_Fiber optic") so we split on
+    # newlines only. Frozen as a tuple with an O(1) name→slot dict.
     with open(feature_file) as f:
-        FEATURE_COLS = [ln.strip() for ln in f if ln.strip()]
-    print(f"✅ Loaded {len(FEATURE_COLS)} feature columns")
+        raw = f.read()
+    FEATURE_COLS = tuple(
+        name for name in (ln.strip() for ln in raw.splitlines()) if name
+    )
+    FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_COLS)}
+    FEATURE_SET = frozenset(FEATURE_COLS)
+    log.info("Loaded %d feature columns", len(FEATURE_COLS))
 else:
     raise RuntimeError(
         f"❌ feature_columns.txt not found in {MODEL_DIR}.\n"
@@ -67,73 +110,353 @@ BINARY_MAP = {
     "PaperlessBilling": {"No": 0, "Yes": 1},
 }
 
-NUMERIC_COLS = ["tenure", "MonthlyCharges", "TotalCharges"]
+# Keys pre-stripped so encoding a value is a single dict lookup against
+# the stripped input — no Series chain, no repeated normalization.
+BINARY_MAP_NORM = {
+    col: {key.strip(): val for key, val in mapping.items()}
+    for col, mapping in BINARY_MAP.items()
+}
 
 # ============================================================
-# TRANSFORMATION PIPELINE (TRAIN/SERVE CONSISTENT)
+# PRECOMPUTED OUTPUT SLOTS (BUILT ONCE AT LOAD TIME)
 # ============================================================
+# FEATURE_COLS is fixed once the model is loaded, so we resolve every
+# raw input column to its output slot(s) up front instead of rebuilding
+# dummy columns with pd.get_dummies + reindex on every request.
+#
+# DIRECT_INDEX: feature name (binary / numeric passthrough) → slot
+# ONEHOT_INDEX: raw categorical column → {category value → slot}
+# One-hot feature names follow the get_dummies convention f"{col}_{value}".
 
-def _serve_transform(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df.columns = df.columns.str.strip()
-
-    # Numeric coercion
-    for col in NUMERIC_COLS:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-
-    # Binary encoding
-    for col, mapping in BINARY_MAP.items():
-        if col in df.columns:
-            df[col] = (
-                df[col]
-                .astype(str)
-                .str.strip()
-                .map(mapping)
-                .fillna(0)
-                .astype(int)
+DIRECT_INDEX = {}
+ONEHOT_INDEX = {}
+
+for _slot, _name in enumerate(FEATURE_COLS):
+    _col, _sep, _value = _name.partition("_")
+    if _sep:
+        ONEHOT_INDEX.setdefault(_col, {})[_value] = _slot
+    else:
+        DIRECT_INDEX[_name] = _slot
+
+# ============================================================
+# COMPILED SINGLE-RECORD TRANSFORM (SPECIALIZED AT LOAD TIME)
+# ============================================================
+# The serving hot path always sees the same ~19 input keys, so instead
+# of re-discovering dtypes and columns per call we generate a function
+# body specialized to FEATURE_COLS once and exec it. The result reads
+# the raw input dict directly and fills a float32 row vector — no
+# DataFrame construction, no dtype introspection per request.
+
+def _build_compiled_transform():
+    lines = [
+        "def _compiled_transform(input_dict):",
+        f"    out = np.zeros({len(FEATURE_COLS)}, dtype=np.float32)",
+    ]
+    for col, slot in DIRECT_INDEX.items():
+        if col in BINARY_MAP:
+            lines.append(
+                f"    out[{slot}] = _BINARY[{col!r}].get("
+                f"str(input_dict.get({col!r}, '')).strip(), 0)"
             )
+        else:
+            # Numeric passthrough: plain float() with NaN guarded to 0.
+            lines += [
+                f"    try:",
+                f"        v = float(input_dict.get({col!r}, 0) or 0)",
+                f"    except (TypeError, ValueError):",
+                f"        v = 0.0",
+                f"    out[{slot}] = v if v == v else 0.0",
+            ]
+    for col in ONEHOT_INDEX:
+        lines += [
+            f"    slot = _ONEHOT[{col!r}].get("
+            f"str(input_dict.get({col!r}, '')).strip())",
+            f"    if slot is not None:",
+            f"        out[slot] = 1.0",
+        ]
+    lines.append("    return out")
+    namespace = {"np": np, "_BINARY": BINARY_MAP_NORM, "_ONEHOT": ONEHOT_INDEX}
+    exec(compile("\n".join(lines), "<serve_transform>", "exec"), namespace)
+    return namespace["_compiled_transform"]
+
+_compiled_transform = _build_compiled_transform()
+
+# ============================================================
+# TRANSFORMATION PIPELINE (TRAIN/SERVE CONSISTENT)
+# ============================================================
 
-    # One-hot encode remaining categoricals
-    obj_cols = df.select_dtypes(include=["object"]).columns.tolist()
-    if obj_cols:
-        df = pd.get_dummies(df, columns=obj_cols, drop_first=True)
+def _coerce_float(value) -> float:
+    try:
+        v = float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    return v if v == v else 0.0
+
+
+def _transform_rows(df: pd.DataFrame) -> np.ndarray:
+    # Assemble output rows directly against the training schema:
+    # each input column writes into its precomputed slot, so no dummy
+    # columns are ever materialised and no reindex pass is needed.
+    # The input frame is only read, never mutated, so no defensive copy;
+    # column names are stripped on the fly.
+    out = np.zeros((len(df), len(FEATURE_COLS)), dtype=np.float32)
 
-    # Boolean → int
-    bool_cols = df.select_dtypes(include=["bool"]).columns
-    if len(bool_cols) > 0:
-        df[bool_cols] = df[bool_cols].astype(int)
+    for raw_name in df.columns:
+        col = raw_name.strip()
+        # Drop to the ndarray once per column; everything below iterates
+        # or casts raw values without touching Series machinery.
+        values = df[raw_name].to_numpy()
+        if col in BINARY_MAP_NORM:
+            mapping = BINARY_MAP_NORM[col]
+            if col in FEATURE_SET:
+                slot = FEATURE_INDEX[col]
+                out[:, slot] = [mapping.get(str(v).strip(), 0) for v in values]
+        elif col in ONEHOT_INDEX:
+            slots = ONEHOT_INDEX[col]
+            for row, v in enumerate(values):
+                slot = slots.get(str(v).strip())
+                if slot is not None:
+                    out[row, slot] = 1.0
+        elif col in FEATURE_SET:
+            # Single vectorized cast; fall back to per-value float
+            # coercion only for dirty object columns.
+            try:
+                arr = values.astype(np.float32)
+            except (TypeError, ValueError):
+                arr = np.array(
+                    [_coerce_float(v) for v in values], dtype=np.float32
+                )
+            out[:, FEATURE_INDEX[col]] = np.nan_to_num(arr)
 
-    # Align with training schema
-    df = df.reindex(columns=FEATURE_COLS, fill_value=0)
+    return out
 
-    return df
+
+# ============================================================
+# TRANSFORM PARITY SELF-CHECK (FAIL FAST ON ENCODING DRIFT)
+# ============================================================
+# The compiled single-record closure and the multi-row batch transform
+# must encode the same record identically — this is the guarantee the
+# old pd.get_dummies path silently violated (drop_first=True on a 1-row
+# frame dropped the only category level, zeroing every one-hot slot).
+# Run one representative record through both paths at import and refuse
+# to serve if they disagree.
+
+_PARITY_RECORD = {
+    "gender": "Male",
+    "SeniorCitizen": 0,
+    "Partner": "Yes",
+    "Dependents": "No",
+    "tenure": 5,
+    "PhoneService": "Yes",
+    "MultipleLines": "No",
+    "InternetService": "Fiber optic",
+    "OnlineSecurity": "No",
+    "OnlineBackup": "Yes",
+    "DeviceProtection": "No",
+    "TechSupport": "No",
+    "StreamingTV": "Yes",
+    "StreamingMovies": "Yes",
+    "Contract": "Month-to-month",
+    "PaperlessBilling": "Yes",
+    "PaymentMethod": "Electronic check",
+    "MonthlyCharges": 70.35,
+    "TotalCharges": 350.75,
+}
+
+_single = _compiled_transform(_PARITY_RECORD)
+_batch = _transform_rows(pd.DataFrame([_PARITY_RECORD]))[0]
+if not np.array_equal(_single, _batch):
+    raise RuntimeError(
+        "❌ Single-record and batch transforms disagree on the same "
+        "record.\nThe generated closure has drifted from "
+        "_transform_rows – refusing to serve inconsistent encodings."
+    )
+del _single, _batch
+
+
+def _predict_batch(arr: np.ndarray) -> list:
+    # Route a (B, F) float32 matrix to the model: straight to the raw
+    # estimator when unwrapped, else through pyfunc with one wrap.
+    if _raw_predict is not None:
+        preds = _raw_predict(arr)
+    else:
+        preds = model.predict(
+            pd.DataFrame(arr, columns=list(FEATURE_COLS), copy=False)
+        )
+    if hasattr(preds, "tolist"):
+        preds = preds.tolist()
+    return preds
+
+# ============================================================
+# MODEL WARM-UP (PAY COLD-START COSTS AT IMPORT, NOT FIRST REQUEST)
+# ============================================================
+# The first predict call triggers one-off costs (model deserialization
+# lazies, NumPy thread-pool spin-up, MLflow schema construction). Run a
+# throwaway two-row batch now so the first real request doesn't pay
+# them; two rows also exercise any internal batch codepath.
+
+try:
+    _predict_batch(np.zeros((2, len(FEATURE_COLS)), dtype=np.float32))
+    log.info("Model warmed up")
+except Exception as e:
+    log.warning("Model warm-up failed (continuing): %s", e)
 
 # ============================================================
 # PREDICTION FUNCTION (SAFE & DETERMINISTIC)
 # ============================================================
 
-def predict(input_dict: dict) -> str:
+def format_prediction(pred: int) -> str:
+    """
+    Render a numeric churn prediction as a user-facing label.
+
+    Kept separate from predict() so batched callers can stay numeric
+    until the response-serialization edge.
+    """
+    return "Likely to churn" if pred == 1 else "Not likely to churn"
+
+
+def predict(input_dict: dict) -> int:
     """
     Perform churn prediction on a single customer record.
+
+    Returns 1 (churn) or 0 (no churn); use format_prediction() to
+    render the label at the response edge.
     """
 
     if model is None:
         raise RuntimeError("Model is not loaded – inference aborted.")
 
-    # Convert input → DataFrame
-    df = pd.DataFrame([input_dict])
-
-    # Transform features
-    df_enc = _serve_transform(df)
+    # Transform straight from the dict — no intermediate DataFrame,
+    # no copy: one stripped-key pass, then the compiled transform.
+    record = {k.strip(): v for k, v in input_dict.items()}
+    arr = _compiled_transform(record)
 
     # Predict
     try:
-        preds = model.predict(df_enc)
-        if hasattr(preds, "tolist"):
-            preds = preds.tolist()
-        result = preds[0]
+        result = _predict_batch(arr.reshape(1, -1))[0]
     except Exception as e:
         raise RuntimeError(f"Model prediction failed: {e}")
 
-    return "Likely to churn" if result == 1 else "Not likely to churn"
+    return int(result)
+
+
+def predict_many(records: list) -> list:
+    """
+    Batch churn prediction for a list of customer records.
+
+    Transforms every record into one (B, F) matrix and issues a single
+    model call, so the fixed per-call overhead is paid once per batch
+    instead of once per record. Returns one 0/1 prediction per record.
+    """
+
+    if model is None:
+        raise RuntimeError("Model is not loaded – inference aborted.")
+
+    if not records:
+        return []
+
+    arr = np.zeros((len(records), len(FEATURE_COLS)), dtype=np.float32)
+    for i, record in enumerate(records):
+        arr[i] = _compiled_transform(
+            {k.strip(): v for k, v in record.items()}
+        )
+
+    try:
+        preds = _predict_batch(arr)
+    except Exception as e:
+        raise RuntimeError(f"Model prediction failed: {e}")
+
+    return [int(pred) for pred in preds]
+
+# ============================================================
+# DYNAMIC REQUEST BATCHING (AMORTIZE PER-CALL MODEL OVERHEAD)
+# ============================================================
+# Every model.predict call pays fixed MLflow validation/conversion cost
+# regardless of batch size. Under concurrent load, coalescing requests
+# that arrive within BATCH_TIMEOUT into one stacked predict call
+# amortizes that cost across the batch.
+
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "32"))
+BATCH_TIMEOUT = float(os.environ.get("BATCH_TIMEOUT_MS", "10")) / 1000.0
+
+_batch_queue = None
+_batch_worker_task = None
+
+
+async def _batch_worker():
+    loop = asyncio.get_running_loop()
+    while True:
+        # Block for the first request. If nothing else is queued the
+        # batch is dispatched immediately — an uncontended request never
+        # waits out the timeout window. Only while more requests are
+        # already arriving do we hold the window open to fill the batch.
+        rows, futures = [], []
+        row, future = await _batch_queue.get()
+        rows.append(row)
+        futures.append(future)
+
+        if not _batch_queue.empty():
+            deadline = loop.time() + BATCH_TIMEOUT
+            while len(rows) < MAX_BATCH_SIZE:
+                try:
+                    row, future = _batch_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        row, future = await asyncio.wait_for(
+                            _batch_queue.get(), timeout=remaining
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                rows.append(row)
+                futures.append(future)
+
+        try:
+            # Run inference off the event loop so the server keeps
+            # accepting and transforming requests (and serving the UI)
+            # while a batch is in flight; new arrivals queue up into
+            # the next batch.
+            preds = await loop.run_in_executor(
+                None, _predict_batch, np.vstack(rows)
+            )
+            for fut, pred in zip(futures, preds):
+                if not fut.done():
+                    fut.set_result(pred)
+        except Exception as e:
+            err = RuntimeError(f"Model prediction failed: {e}")
+            for fut in futures:
+                if not fut.done():
+                    fut.set_exception(err)
+
+
+def _ensure_batch_worker():
+    global _batch_queue, _batch_worker_task
+    if _batch_worker_task is None or _batch_worker_task.done():
+        _batch_queue = asyncio.Queue()
+        _batch_worker_task = asyncio.get_running_loop().create_task(
+            _batch_worker()
+        )
+
+
+async def predict_async(input_dict: dict) -> int:
+    """
+    Batched variant of predict() for async servers.
+
+    Transforms the record immediately, then hands the row to the shared
+    batch worker so concurrent requests share one model.predict call.
+    Returns 1 (churn) or 0 (no churn), like predict().
+    """
+    if model is None:
+        raise RuntimeError("Model is not loaded – inference aborted.")
+
+    record = {k.strip(): v for k, v in input_dict.items()}
+    arr = _compiled_transform(record)
+
+    _ensure_batch_worker()
+    future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((arr, future))
+    result = await future
+
+    return int(result)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import Tuple, List
 
@@ -58,10 +59,27 @@ def validate_telco_data(df) -> Tuple[bool, List[str]]:
         "InternetService": ["DSL", "Fiber optic", "No"]
     }
     
-    for col, valid_values in categorical_checks.items():
+    # Work on category codes instead of object-dtype string pointers:
+    # isin/equality become integer ops and the columns shrink ~8x.
+    # assign() keeps the caller's dataframe untouched.
+    present_cat = [c for c in categorical_checks if c in df.columns]
+    if present_cat:
+        df = df.assign(**{c: df[c].astype("category") for c in present_cat})
+
+    # Compute every invalid-value count in one concatenated boolean
+    # matrix + single reduction instead of a full-column scan per check
+    invalid_counts = {}
+    if present_cat:
+        invalid_mask = pd.concat(
+            {c: ~df[c].isin(categorical_checks[c]) for c in present_cat},
+            axis=1,
+        )
+        invalid_counts = invalid_mask.sum(axis=0).to_dict()
+
+    for col in categorical_checks:
         total_checks += 1
         if col in df.columns:
-            invalid_count = (~df[col].isin(valid_values)).sum()
+            invalid_count = int(invalid_counts.get(col, 0))
             if invalid_count > 0:
                 failed_expectations.append(f"{col} has {invalid_count} invalid values")
                 validation_passed = False
@@ -79,20 +97,34 @@ def validate_telco_data(df) -> Tuple[bool, List[str]]:
         ("TotalCharges", 0, None)
     ]
     
+    # Broadcast all min/max bounds against the numeric block at once:
+    # two dataframe-wide comparisons replace one scan per bound
+    present_num = [c for c, _, _ in numeric_checks if c in df.columns]
+    below = above = {}
+    if present_num:
+        num_df = df[present_num]
+        mins = pd.Series({c: mn for c, mn, _ in numeric_checks if c in present_num})
+        maxs = pd.Series(
+            {c: mx for c, _, mx in numeric_checks if c in present_num and mx is not None}
+        )
+        below = num_df.lt(mins, axis=1).any(axis=0)
+        if len(maxs) > 0:
+            above = num_df[list(maxs.index)].gt(maxs, axis=1).any(axis=0)
+
     for col, min_val, max_val in numeric_checks:
         if col in df.columns:
             # Check min value
             total_checks += 1
-            if (df[col] < min_val).any():
+            if below[col]:
                 failed_expectations.append(f"{col} has values below {min_val}")
                 validation_passed = False
             else:
                 checks_passed += 1
-            
+
             # Check max value if specified
             if max_val is not None:
                 total_checks += 1
-                if (df[col] > max_val).any():
+                if above[col]:
                     failed_expectations.append(f"{col} has values above {max_val}")
                     validation_passed = False
                 else:
@@ -117,7 +149,11 @@ def validate_telco_data(df) -> Tuple[bool, List[str]]:
     # TotalCharges should generally be >= MonthlyCharges (95% threshold)
     total_checks += 1
     if "TotalCharges" in df.columns and "MonthlyCharges" in df.columns:
-        inconsistent = (df["TotalCharges"] < df["MonthlyCharges"]).sum()
+        # Compare the underlying arrays directly: skips pandas alignment
+        # and Series construction for a plain elementwise compare
+        arr_total = df["TotalCharges"].to_numpy(copy=False)
+        arr_monthly = df["MonthlyCharges"].to_numpy(copy=False)
+        inconsistent = int(np.less(arr_total, arr_monthly).sum())
         inconsistent_pct = inconsistent / len(df)
         if inconsistent_pct > 0.05:  # More than 5% inconsistent
             failed_expectations.append(